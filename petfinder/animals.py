@@ -2,11 +2,14 @@ import asyncio
 from math import ceil
 from typing import (
     List,
-    Set,
+    FrozenSet,
     TypeVar,
-    Dict,
     ClassVar,
     Iterable,
+    Optional,
+    Dict,
+    Tuple,
+    Callable,
 )
 
 import pandas as pd
@@ -15,11 +18,13 @@ from pydantic.fields import Field
 from pydantic.types import conint, PositiveInt
 
 from petfinder.enums import Category, Age, Gender, Coat, Status, Size, Sort
-from petfinder.pandas import animals_dataframe, photos_dataframe, tags_dataframe
+from petfinder.pandas import DataFrames, dataframes
 from petfinder.query import Query, QueryParams
 from petfinder.schemas import Animal, AnimalsResponse
+from petfinder.static import StaticData, category_value
 from petfinder.types import (
     AgeType,
+    CategoryType,
     GenderType,
     CoatType,
     StatusType,
@@ -31,9 +36,9 @@ T = TypeVar("T")
 
 
 class InvalidChoice(ValueError):
-    def __init__(self, field_name, choice, valid_choices):
+    def __init__(self, field_name, choices, valid_choices):
         super().__init__(
-            f"{choice} is not a valid {field_name}; valid options are {sorted(valid_choices)}"
+            f"Invalid {field_name} choices {choices}; valid options are {sorted(valid_choices)}"
         )
 
 
@@ -55,6 +60,16 @@ class MissingAnimalType(Exception):
         )
 
 
+_SORTS_REQUIRING_LOCATION = frozenset((Sort.distance, Sort.reverse_distance))
+
+
+# For each kind of static data: the path it's fetched from, and how to extract the names
+_STATIC_DATA_SOURCES: Dict[str, Tuple[str, Callable[[dict], Iterable[str]]]] = {
+    "breeds": ("types/{}/breeds", lambda r: (x["name"] for x in r["breeds"])),
+    "colors": ("types/{}", lambda r: r["type"]["colors"]),
+}
+
+
 class AnimalQueryParams(QueryParams):
     type: Category = None
     breed: List[str] = None
@@ -73,38 +88,49 @@ class AnimalQueryParams(QueryParams):
     page: conint(ge=1) = Field(1, description="Page of results to return")
 
     @root_validator(pre=True)
-    def check_dependencies_and_categoricals(cls, values: dict) -> dict:
+    def check_dependencies(cls, values: dict) -> dict:
         """
         Check through the values for field mismatches that result in a 400 (bad request) from the api.
         """
         if values.get("location") is None:
             if values.get("distance"):
                 raise MissingDependency("distance", "location")
-            if values.get("sort") in (Sort.distance, Sort.reverse_distance):
+            if values.get("sort") in _SORTS_REQUIRING_LOCATION:
                 raise MissingDependency(f"'sort = {values['sort']}'", "location")
+        return values
+
+    @root_validator(pre=True)
+    def check_categoricals(cls, values: dict) -> dict:
+        """
+        Check that breeds and colors are valid for the type of animal.
+        The valid choices may need to be fetched from the api, so this is skipped entirely
+        unless a breed or color has actually been specified.
+        """
+        if not values.get("type") or not (values.get("breed") or values.get("color")):
+            return values
 
         query: AnimalsQuery = values["__query__"]
 
-        if values.get("type") and values.get("breed"):
+        if values.get("breed"):
             valid_breeds = query.get_breeds()
-            for breed in values["breed"]:
-                if breed.lower() not in valid_breeds:
-                    raise InvalidChoice("breed", breed, valid_breeds)
+            invalid = [b for b in values["breed"] if b.lower() not in valid_breeds]
+            if invalid:
+                raise InvalidChoice("breed", invalid, valid_breeds)
 
-        if values.get("type") and values.get("color"):
+        if values.get("color"):
             valid_colors = query.get_colors()
-            for color in values["color"]:
-                if color.lower() not in valid_colors:
-                    raise InvalidChoice("color", color, valid_colors)
+            invalid = [c for c in values["color"] if c.lower() not in valid_colors]
+            if invalid:
+                raise InvalidChoice("color", invalid, valid_colors)
 
         return values
 
 
 class AnimalsQuery(Query[AnimalsResponse]):
+    __slots__ = ()
     params_class = AnimalQueryParams
-    # Breeds and colors don't change, so we'll keep them cached as a class variable
-    _cached_breeds: ClassVar[Dict[Category, Set[str]]] = {}
-    _cached_colors: ClassVar[Dict[Category, Set[str]]] = {}
+    # Breeds and colors don't change, so they are shared by all queries and persisted to disk
+    static_data: ClassVar[StaticData] = StaticData()
 
     def filter(
         self: T,
@@ -121,25 +147,30 @@ class AnimalsQuery(Query[AnimalsResponse]):
         distance: int = None,
         name: str = None,
     ) -> T:
-        return self._chain(
-            **{
-                k: v
-                for k, v in (
-                    ("status", status),
-                    ("age", ages),
-                    ("size", sizes),
-                    ("gender", genders),
-                    ("breed", breeds),
-                    ("coat", coats),
-                    ("color", colors),
-                    ("organization", organizations),
-                    ("location", location),
-                    ("distance", distance),
-                    ("name", name),
-                )
-                if v is not None
-            }
-        )
+        params = {}
+        if status is not None:
+            params["status"] = status
+        if ages is not None:
+            params["age"] = ages
+        if sizes is not None:
+            params["size"] = sizes
+        if genders is not None:
+            params["gender"] = genders
+        if breeds is not None:
+            params["breed"] = breeds
+        if coats is not None:
+            params["coat"] = coats
+        if colors is not None:
+            params["color"] = colors
+        if organizations is not None:
+            params["organization"] = organizations
+        if location is not None:
+            params["location"] = location
+        if distance is not None:
+            params["distance"] = distance
+        if name is not None:
+            params["name"] = name
+        return self._chain(**params)
 
     def limit(self: T, value: int) -> T:
         return self._chain(limit=value)
@@ -150,65 +181,137 @@ class AnimalsQuery(Query[AnimalsResponse]):
     def page(self: T, number: int) -> T:
         return self._chain(page=number)
 
-    def get_breeds(self) -> Set[str]:
+    def get_breeds(self) -> FrozenSet[str]:
         """
         Returns a set of the breeds for a type of animal
         """
-        t = self.params.get("type")
-        if not t:
-            raise MissingAnimalType(method_call=".breeds()")
-        elif t not in self._cached_breeds:
-            query: Query[dict] = self.new_query(path=f"types/{t}/breeds")
-            self._cached_breeds[t] = set(
-                x["name"].lower() for x in query.execute()["breeds"]
-            )
-        return self._cached_breeds[t]
+        return self.get_static_data("breeds")
 
-    def get_colors(self) -> Set[str]:
+    def get_colors(self) -> FrozenSet[str]:
         """
         Returns a set of the colors for a type of animal
         """
+        return self.get_static_data("colors")
+
+    def get_static_data(self, field: str) -> FrozenSet[str]:
+        """
+        Returns a set of the valid values of a field (breeds or colors) for a type of animal
+        """
         t = self.params.get("type")
         if not t:
-            raise MissingAnimalType(method_call=".colors()")
-        elif t not in self._cached_colors:
-            query: Query[dict] = self.new_query(path=f"types/{t}")
-            self._cached_colors[t] = set(
-                x.lower() for x in query.execute()["type"]["colors"]
-            )
-        return self._cached_colors[t]
+            raise MissingAnimalType(method_call=f".{field}()")
+        t = category_value(t)
+        self.static_data.load()
+        values = self.static_data.get(t, field)
+        if values is None:
+            path, extract = _STATIC_DATA_SOURCES[field]
+            query: Query[dict] = self.new_query(path=path.format(t))
+            self.static_data.set(t, field, extract(query.execute()))
+            self.static_data.save()
+            values = self.static_data.get(t, field)
+        return values
+
+    def load_static_data(self, categories: Iterable[CategoryType] = Category) -> None:
+        """
+        Fetches the breeds and colors for several types of animals at once.
+        Otherwise they are fetched one request at a time, the first time each type is validated.
+        """
+        asyncio.new_event_loop().run_until_complete(
+            self.async_load_static_data(categories)
+        )
+
+    async def async_load_static_data(
+        self, categories: Iterable[CategoryType] = Category
+    ) -> None:
+        """
+        Fetches the breeds and colors for several types of animals concurrently.
+        Types which were already fetched (or persisted by a previous process) are skipped.
+        """
+        self.static_data.load()
+        missing = [
+            (c, field)
+            for c in map(category_value, categories)
+            for field in _STATIC_DATA_SOURCES
+            if self.static_data.get(c, field) is None
+        ]
+        if not missing:
+            return
+        queries = [
+            self.new_query(path=_STATIC_DATA_SOURCES[field][0].format(c))
+            for c, field in missing
+        ]
+        responses = await self.async_batch_executor(
+            queries, concurrency=len(queries)
+        )
+        for (c, field), response in zip(missing, responses):
+            self.static_data.set(c, field, _STATIC_DATA_SOURCES[field][1](response))
+        self.static_data.save()
 
     def get_total_count(self) -> int:
         """
         Returns the total number of animals which exist for this query.
         This is only intended to serve as a convenience function for debugging or exploring.
         """
-        return self.execute()["pagination"]["total_count"]
+        # Only the pagination info is needed, so don't ask for more than a single animal
+        return self.limit(1).page(1).execute()["pagination"]["total_count"]
 
     def get_total_pages(self) -> int:
         """
         Returns the total number of pages which exist for this query.
         """
-        return self.execute()["pagination"]["total_pages"]
+        return ceil(self.get_total_count() / self.params.get("limit", 100))
 
-    def search(self, limit: int = 100, start_page: int = 1) -> "SearchResults":
+    def search(
+        self, limit: int = 100, start_page: int = 1, concurrency: int = 8
+    ) -> "SearchResults":
         """
         Convenience wrapper for searching synchronously.
         If you're going to perform multiple searches, you should probably be calling async_search directly.
         """
         return asyncio.new_event_loop().run_until_complete(
-            self.async_search(limit=limit, start_page=start_page)
+            self.async_search(
+                limit=limit, start_page=start_page, concurrency=concurrency
+            )
         )
 
     async def async_search(
-        self, limit: int = 100, start_page: int = 1
+        self, limit: int = 100, start_page: int = 1, concurrency: int = 8
     ) -> "SearchResults":
         """
         Performs a search asynchronously and formats the results.
+        At most `concurrency` pages will be requested at the same time.
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, not {concurrency}")
         num_pages = ceil(limit / 100)
-        queries = [self.page(n).limit(100) for n in range(start_page, num_pages + 1)]
-        pages = await self.async_batch_executor(queries)
+        if num_pages < 1:
+            return SearchResults(
+                query=self, pages=[], limit=limit, start_page=start_page
+            )
+        # Pages are numbered in units of 100 records, so only a single-page search starting
+        # at the first page can safely request fewer records without shifting the offset.
+        page_size = limit if num_pages == 1 and start_page == 1 else 100
+        # Validate the first page once up front; the pages chained from it only differ by
+        # their (larger) page number, so they don't need to be validated again
+        query = self._chain(page=start_page, limit=page_size).validated()
+        # Every page is sent over the same connection(s), rather than opening new ones
+        async with self.open_async_session() as client:
+            first_page = await query.async_execute(client=client)
+            # Don't bother requesting pages beyond the end of the results
+            num_pages = min(
+                num_pages, first_page["pagination"]["total_pages"] - start_page + 1
+            )
+            queries = [
+                query._chain(page=n, limit=page_size)
+                for n in range(start_page + 1, start_page + num_pages)
+            ]
+            pages = [first_page]
+            if queries:
+                pages.extend(
+                    await self.async_batch_executor(
+                        queries, client=client, concurrency=concurrency
+                    )
+                )
         return SearchResults(
             query=self, pages=pages, limit=limit, start_page=start_page
         )
@@ -219,6 +322,8 @@ class SearchResults:
     pages: Iterable[AnimalsResponse]
     limit: int
     start_page: int
+    _records: Optional[List[Animal]]
+    _dataframes: Optional[DataFrames]
 
     def __init__(
         self,
@@ -231,22 +336,36 @@ class SearchResults:
         self.pages = pages
         self.limit = limit
         self.start_page = start_page
+        self._records = None
+        self._dataframes = None
 
     def __str__(self) -> str:
         return f"Search results for {self.query}, limit = {self.limit}, start_page = {self.start_page}"
 
     @property
     def records(self) -> List[Animal]:
-        return [r for p in self.pages for r in p["animals"]]
+        if self._records is None:
+            self._records = [r for p in self.pages for r in p["animals"]][: self.limit]
+        return self._records
+
+    @property
+    def dataframes(self) -> DataFrames:
+        """
+        The animals, photos, and tags DataFrames, which are all built together the first time
+        any of them is accessed.
+        """
+        if self._dataframes is None:
+            self._dataframes = dataframes(self.records)
+        return self._dataframes
 
     @property
     def dataframe(self) -> pd.DataFrame:
-        return animals_dataframe(self.records)
+        return self.dataframes.animals
 
     @property
     def photos_dataframe(self) -> pd.DataFrame:
-        return photos_dataframe(self.records)
+        return self.dataframes.photos
 
     @property
     def tags_dataframe(self) -> pd.DataFrame:
-        return tags_dataframe(self.records)
+        return self.dataframes.tags
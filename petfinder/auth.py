@@ -19,7 +19,14 @@ class TokenAuth(Auth):
 
         The authentication 'flow' ends when the generator is exhausted, and the final response is
         used as the real one.
+
+        If there is no token yet, one is requested up front rather than sending a request which
+        is certain to fail. An expired token is refreshed at most once per request.
         """
+        if self.token is None:
+            token_response = yield self.build_token_request()
+            self.update_token(token_response)
+
         request.headers["Authorization"] = f"Bearer {self.token}"
         response = yield request
 
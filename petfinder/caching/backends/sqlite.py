@@ -2,7 +2,7 @@ import os
 import sqlite3
 import time
 from types import TracebackType
-from typing import Type, Union, NamedTuple
+from typing import Optional, Type, Union
 
 from petfinder.caching.core import (
     RequestsCache,
@@ -12,12 +12,6 @@ from petfinder.caching.core import (
 )
 
 
-class Row(NamedTuple):
-    key: bytes
-    timestamp: float
-    response: bytes
-
-
 _CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS requests (
     key blob PRIMARY KEY,
@@ -35,13 +29,13 @@ class SqliteCache(RequestsCache):
         self,
         db_file: str = None,
         time_to_live: TimeToLiveCallback = default_ttl_callback,
+        memory_size: int = 256,
     ) -> None:
-        super().__init__(time_to_live)
+        super().__init__(time_to_live, memory_size)
         self.db_file = db_file or os.path.join(data_directory(), "sqlite.db")
         self.conn = None
         with Cursor(self) as c:
             c.execute(_CREATE_TABLE)
-        # self.clean()
 
     def open(self):
         self.conn = sqlite3.connect(self.db_file)
@@ -90,10 +84,11 @@ class SqliteCache(RequestsCache):
             c.execute("SELECT 1 FROM requests WHERE key = ? LIMIT 1", (key,))
             return bool(c.fetchone())
 
-    def get_timestamp(self, key: bytes) -> int:
+    def get_timestamp(self, key: bytes) -> Optional[float]:
         with Cursor(self) as c:
             c.execute("SELECT timestamp FROM requests WHERE key = ? LIMIT 1", (key,))
-            return c.fetchone()[0]
+            row = c.fetchone()
+            return None if row is None else row[0]
 
 
 class Cursor:
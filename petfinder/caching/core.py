@@ -1,8 +1,10 @@
 import abc
 import pickle
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Union, TypedDict, TypeVar, NamedTuple
+from typing import Callable, Optional, Union, TypedDict, TypeVar, NamedTuple
 
 import appdirs
 from httpx import Request, Response, Headers, URL
@@ -21,6 +23,20 @@ class CachedResponse(TypedDict):
     content: bytes
 
 
+@lru_cache(maxsize=4096)
+def pickle_request(url: URL, method: str, content: bytes) -> bytes:
+    """
+    Pickles the parts of a request which identify it. This happens several times for every
+    request (checking, reading, and saving the cache) so the results are memoized.
+    """
+    return pickle.dumps(CachedRequest(url, method, content))
+
+
+@lru_cache(maxsize=4096)
+def unpickle_request(key: bytes) -> CachedRequest:
+    return pickle.loads(key)
+
+
 TimeToLive = Union[None, int]
 TimeToLiveCallback = Callable[[CachedRequest], TimeToLive]
 
@@ -48,11 +64,17 @@ def data_directory() -> str:
 
 class RequestsCache:
     time_to_live: TimeToLiveCallback
+    memory_size: int
+    memory: "OrderedDict[bytes, CachedResponse]"
 
     def __init__(
-        self, time_to_live: TimeToLiveCallback = default_ttl_callback,
+        self,
+        time_to_live: TimeToLiveCallback = default_ttl_callback,
+        memory_size: int = 256,
     ):
         self.time_to_live = time_to_live
+        self.memory_size = memory_size
+        self.memory = OrderedDict()
 
     @abc.abstractmethod
     def open(self):
@@ -87,51 +109,68 @@ class RequestsCache:
         ...
 
     @abc.abstractmethod
-    def get_timestamp(self, key: bytes) -> int:
-        ...
+    def get_timestamp(self, key: bytes) -> Optional[float]:
+        """
+        Returns when the key was cached, or None if it is not in the cache.
+        """
 
     def create_key(self, request: Request) -> bytes:
         """
         Converts a request into the cache key
         """
-        return pickle.dumps(CachedRequest(request.url, request.method, request.read()))
+        return pickle_request(request.url, request.method, request.read())
 
     def deserialize_key(self, key: bytes) -> CachedRequest:
         """
         Converts a key back into the cached request representation.
         """
-        return pickle.loads(key)
+        return unpickle_request(key)
 
     def serialize_response(self, response: Response) -> bytes:
         """
         Converts a response to a bytes representation that can be saved anywhere.
+        Only the raw header pairs and body bytes are stored, so nothing needs to be decoded
+        and the (much larger) body is written by pickle as a single bytes object.
         """
         return pickle.dumps(
-            CachedResponse(headers=response.headers, content=response.content)
+            (response.headers.raw, response.content), pickle.HIGHEST_PROTOCOL
         )
 
     def deserialize_response(self, data: bytes) -> CachedResponse:
         """
         Convert the bytes representation from serialize_response back into a CachedResponse.
         """
-        return pickle.loads(data)
+        value = pickle.loads(data)
+        if isinstance(value, dict):
+            # Saved by an older version, which pickled the CachedResponse itself
+            return value
+        headers, content = value
+        return CachedResponse(headers=Headers(headers), content=content)
 
-    def is_expired(self, key: bytes) -> bool:
+    def is_expired(self, key: bytes, timestamp: float = None) -> bool:
         """
         Return true if a cached response has expired.
         """
+        if timestamp is None:
+            timestamp = self.get_timestamp(key)
         ttl = self.time_to_live(self.deserialize_key(key)) or 0
-        return (time.time() - self.get_timestamp(key)) > ttl
+        return (time.time() - timestamp) > ttl
 
     def has(self, request: Request) -> bool:
         """
         Returns true if a request exists in the cache.
         """
         key = self.create_key(request)
-        if key not in self:
+        try:
+            timestamp = self.get_timestamp(key)
+        except KeyError:
+            # Backends written before get_timestamp returned None for missing keys raise instead
             return False
-        elif self.is_expired(key):
+        if timestamp is None:
+            return False
+        elif self.is_expired(key, timestamp):
             del self[key]
+            self.memory.pop(key, None)
             return False
         return True
 
@@ -144,11 +183,40 @@ class RequestsCache:
         data = self[key]
         return self.deserialize_response(data)
 
+    def get_data(self, request: Request, parse: Callable[[CachedResponse], T]) -> T:
+        """
+        Retrieve the parsed data for a cached response.
+        The most recently used responses are kept in memory, so repeated hits skip reading and
+        deserializing them from the backend. They are still parsed every time, so each caller
+        gets data of its own which it is free to modify.
+        This assumes you have already checked if the request exists in the cache.
+        """
+        key = self.create_key(request)
+        cached_response = self.memory.get(key)
+        if cached_response is None:
+            cached_response = self.get(request)
+            self.remember(key, cached_response)
+        else:
+            self.memory.move_to_end(key)
+        return parse(cached_response)
+
+    def remember(self, key: bytes, cached_response: CachedResponse) -> None:
+        """
+        Keeps a response for a key in memory, evicting the least recently used entry if needed.
+        """
+        self.memory[key] = cached_response
+        if len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
     def save(self, request: Request, response: Response) -> None:
         """
         Saves a request/response pair in the cache IF they should actually be kept.
+        The response is kept in memory as well, so it is served from there the next time the
+        request is made.
         """
         key = self.create_key(request)
         if self.time_to_live(self.deserialize_key(key)):
-            data = self.serialize_response(response)
-            self[key] = data
+            self[key] = self.serialize_response(response)
+            self.remember(
+                key, CachedResponse(headers=response.headers, content=response.content)
+            )
@@ -1,7 +1,6 @@
 import asyncio
-import json
 from types import TracebackType
-from typing import Optional, TypeVar, Any, Union, Type, Iterable, Dict
+from typing import Optional, TypeVar, Any, Union, Type, Iterable, Dict, Tuple
 
 import httpx
 
@@ -10,14 +9,31 @@ from petfinder.auth import TokenAuth
 from petfinder.enums import Category, Age
 from petfinder.caching import RequestsCache, CachedResponse
 from petfinder.query import Query
+from petfinder.serialization import loads
 
 T = TypeVar("T")
 
 
+def http2_available() -> bool:
+    """
+    HTTP/2 support in httpx requires the optional h2 package.
+    """
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class PetfinderClient:
     animals: AnimalsQuery
     cache: Optional[RequestsCache]
     http_kwargs: Dict[str, Any]
+    _http_client: Optional[httpx.Client]
+    _requests: Dict[Tuple[httpx.URL, str], httpx.Request]
+    _in_flight: Dict[
+        Tuple[asyncio.AbstractEventLoop, httpx.URL], "asyncio.Future[bytes]"
+    ]
 
     def __init__(
         self,
@@ -34,15 +50,61 @@ class PetfinderClient:
                 secret=secret, api_key=api_key, token_url=f"{base_url}/oauth2/token",
             ),
             "base_url": base_url,
+            # Every request goes to the same host, so keep plenty of connections alive
+            # (and multiplex them over HTTP/2, if it's available)
+            "limits": httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0
+            ),
+            "http2": http2_available(),
             **httpx_client_kwargs,
         }
+        self._http_client = None
+        self._requests = {}
+        self._in_flight = {}
         self.animals = AnimalsQuery(
             path="animals",
             executor=self.fetch,
             async_executor=self.async_fetch,
             async_batch_executor=self.async_fetch_many,
+            async_session=self.async_session,
         )
 
+    def __enter__(self) -> "PetfinderClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] = None,
+        exc_val: BaseException = None,
+        exc_tb: TracebackType = None,
+    ) -> None:
+        self.close()
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """
+        The httpx client used for synchronous requests. It is created on first use and then kept
+        open, so that its connection pool is reused rather than reconnecting for every request.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(**self.http_kwargs)
+        return self._http_client
+
+    def close(self) -> None:
+        """
+        Closes the connections held by the shared http client.
+        """
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def async_session(self) -> "HttpClient":
+        """
+        Returns a context manager for an async http client (and cache connection) which several
+        asynchronous requests can share, such as all of the pages of a search.
+        """
+        return HttpClient(None, self.http_kwargs, self.cache)
+
     @property
     def dogs(self) -> AnimalsQuery:
         return self.animals._chain(type=Category.dog)
@@ -87,30 +149,74 @@ class PetfinderClient:
         """
         Standard, synchronous execution of a single query.
         """
-        with HttpClient(client, self.http_kwargs, self.cache) as c:
+        with HttpClient(client or self.http_client, self.http_kwargs, self.cache) as c:
             request = self.build_request(query, c)
             if self.cache and self.cache.has(request):
-                return self.process_cached_response(self.cache.get(request))
+                return self.cache.get_data(request, self.process_cached_response)
             return self.process_response(request, c.send(request))
 
     async def async_fetch(self, query: Query[T], client: httpx.AsyncClient = None) -> T:
         """
         Asynchronous execution of a single query.
+        If an identical request is already in flight, this waits for its response instead of
+        sending a duplicate (and parses it separately, so each caller gets its own data).
         """
         async with HttpClient(client, self.http_kwargs, self.cache) as c:
             request = self.build_request(query, c)
             if self.cache and self.cache.has(request):
-                return self.process_cached_response(self.cache.get(request))
-            return self.process_response(request, await c.send(request))
+                return self.cache.get_data(request, self.process_cached_response)
+            # Futures belong to a single event loop, and each search runs its own loop
+            # (possibly on another thread), so requests are only shared within a loop
+            loop = asyncio.get_running_loop()
+            key = (loop, request.url)
+            if key in self._in_flight:
+                shared = self._in_flight[key]
+                try:
+                    return loads(await asyncio.shield(shared))
+                except asyncio.CancelledError:
+                    if not shared.cancelled():
+                        raise
+                # The request was abandoned by whoever sent it, so send it again
+                return await self.async_fetch(query, c)
+            future = loop.create_future()
+            self._in_flight[key] = future
+            try:
+                response = await c.send(request)
+                result = self.process_response(request, response)
+            except Exception as e:
+                future.set_exception(e)
+                # Mark the exception as retrieved, in case nothing else was waiting on it
+                future.exception()
+                raise
+            else:
+                future.set_result(response.content)
+                return result
+            finally:
+                # Cancelled before a response arrived, so release anyone waiting on it
+                if not future.done():
+                    future.cancel()
+                del self._in_flight[key]
 
     async def async_fetch_many(
-        self, queries: Iterable[Query[T]], client: httpx.AsyncClient = None
+        self,
+        queries: Iterable[Query[T]],
+        client: httpx.AsyncClient = None,
+        concurrency: int = 8,
     ) -> Iterable[T]:
         """
         Asynchronous execution of a batch of queries concurrently, returning the results as a list.
+        At most `concurrency` requests will be in flight at any given time.
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_fetch(query: Query[T], c: httpx.AsyncClient) -> T:
+            async with semaphore:
+                return await self.async_fetch(query, c)
+
         async with HttpClient(client, self.http_kwargs, self.cache) as c:
-            return await asyncio.gather(*[self.async_fetch(q, c) for q in queries])
+            return await asyncio.gather(*[bounded_fetch(q, c) for q in queries])
 
     def build_request(
         self, query: Query, client: Union[httpx.Client, httpx.AsyncClient]
@@ -118,30 +224,34 @@ class PetfinderClient:
         """
         Build and return an httpx Request for the given query.
 
-        If a pydantic model for parsing/validating query parameters has been defined,
-        we will now use it to parse the raw query params into a finalized form.
+        Requests without any query params (such as the ones for breeds and colors) are identical
+        every time they're made, so those are built once and then reused.
         """
-        params = (
-            query.params
-            if query.params_class is None
-            else query.params_class(__query__=query, **query.params).dict()
-        )
-        return client.build_request("GET", query.path, params=params)
+        params = query.query_params()
+        if params:
+            return client.build_request("GET", query.path, params=params)
+        key = (client.base_url, query.path)
+        request = self._requests.get(key)
+        if request is None:
+            request = client.build_request("GET", query.path)
+            self._requests[key] = request
+        return request
 
     def process_response(self, request: httpx.Request, response: httpx.Response) -> Any:
         """
         Check for errors, cache the response data (if appropriate), and then return it.
         """
         response.raise_for_status()
+        data = loads(response.content)
         if self.cache is not None:
             self.cache.save(request, response)
-        return response.json()
+        return data
 
     def process_cached_response(self, cached_response: CachedResponse) -> Any:
         """
         Process a cached response, transforming it into the expected output.
         """
-        return json.loads(cached_response["content"].decode("utf-8"))
+        return loads(cached_response["content"])
 
 
 class HttpClient:
@@ -149,6 +259,7 @@ class HttpClient:
     A context manager which allows for efficient reuse of existing client and cache connections.
     """
 
+    __slots__ = ("client", "kwargs", "cache", "close_client", "close_cache")
     client: Union[httpx.Client, httpx.AsyncClient, None]
     kwargs: Dict[str, Any]
     cache: Union[RequestsCache, None]
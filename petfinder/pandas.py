@@ -1,90 +1,197 @@
-from typing import List
+from typing import List, NamedTuple
 
 import pandas as pd
 
 from petfinder.schemas import Animal
 
 
-def animals_dataframe(records: List[Animal]):
-    animals = pd.DataFrame(
-        [
-            {
-                "id": x["id"],
-                "name": x["name"],
-                "type": x["type"],
-                "status": x["status"],
-                "organization_id": x["organization_id"],
-                "species": x.get("species"),
-                "age": x.get("age"),
-                "gender": x.get("gender"),
-                "size": x.get("size"),
-                "coat": x.get("coat"),
-                "published_at": x.get("published_at"),
-                "status_changed_at": x.get("status_changed_at"),
-                "breed_primary": x["breeds"].get("primary"),
-                "breed_secondary": x["breeds"].get("secondary"),
-                "breed_mixed": x["breeds"].get("mixed"),
-                "breed_unknown": x["breeds"].get("unknown"),
-                "color_primary": x["colors"].get("primary"),
-                "color_secondary": x["colors"].get("secondary"),
-                "color_tertiary": x["colors"].get("tertiary"),
-                "spayed_neutered": x["attributes"]["spayed_neutered"],
-                "house_trained": x["attributes"]["house_trained"],
-                "special_needs": x["attributes"]["special_needs"],
-                "shots_current": x["attributes"]["shots_current"],
-                "declawed": x["attributes"].get("declawed"),
-                "good_with_children": x["environment"].get("children"),
-                "good_with_dogs": x["environment"].get("dogs"),
-                "good_with_cats": x["environment"].get("cats"),
-                "description": x.get("description"),
-                "url": x["url"],
-                "number_of_photos": len(x["photos"]),
-                "contact_email": x["contact"].get("email"),
-                "contact_phone": x["contact"].get("phone"),
-                "contact_address1": x["contact"]["address"].get("address1"),
-                "contact_address2": x["contact"]["address"].get("address2"),
-                "contact_city": x["contact"]["address"].get("city"),
-                "contact_state": x["contact"]["address"]["state"],
-                "contact_postcode": x["contact"]["address"]["postcode"],
-                "contact_country": x["contact"]["address"]["country"],
-                "primary_photo_small": (x.get("primary_photo_cropped") or {}).get(
-                    "small"
-                ),
-                "primary_photo_medium": (x.get("primary_photo_cropped") or {}).get(
-                    "medium"
-                ),
-                "primary_photo_large": (x.get("primary_photo_cropped") or {}).get(
-                    "large"
-                ),
-                "primary_photo_full": (x.get("primary_photo_cropped") or {}).get(
-                    "full"
-                ),
-            }
-            for x in records
-        ]
+ANIMAL_COLUMNS = (
+    "id",
+    "name",
+    "type",
+    "status",
+    "organization_id",
+    "species",
+    "age",
+    "gender",
+    "size",
+    "coat",
+    "published_at",
+    "status_changed_at",
+    "breed_primary",
+    "breed_secondary",
+    "breed_mixed",
+    "breed_unknown",
+    "color_primary",
+    "color_secondary",
+    "color_tertiary",
+    "spayed_neutered",
+    "house_trained",
+    "special_needs",
+    "shots_current",
+    "declawed",
+    "good_with_children",
+    "good_with_dogs",
+    "good_with_cats",
+    "description",
+    "url",
+    "number_of_photos",
+    "contact_email",
+    "contact_phone",
+    "contact_address1",
+    "contact_address2",
+    "contact_city",
+    "contact_state",
+    "contact_postcode",
+    "contact_country",
+    "primary_photo_small",
+    "primary_photo_medium",
+    "primary_photo_large",
+    "primary_photo_full",
+)
+
+
+PHOTO_COLUMNS = ("animal_id", "photo_size", "photo_url")
+
+TAG_COLUMNS = ("animal_id", "tag")
+
+
+# Any column not listed here is left for pandas to infer
+ANIMAL_DTYPES = {
+    "id": "int64",
+    "breed_mixed": "boolean",
+    "breed_unknown": "boolean",
+    "spayed_neutered": "boolean",
+    "house_trained": "boolean",
+    "special_needs": "boolean",
+    "shots_current": "boolean",
+    "declawed": "boolean",
+    "good_with_children": "boolean",
+    "good_with_dogs": "boolean",
+    "good_with_cats": "boolean",
+    "number_of_photos": "int64",
+}
+
+
+def animal_row(x: Animal) -> tuple:
+    """
+    Flattens an animal record into a tuple of values, ordered the same as ANIMAL_COLUMNS.
+    """
+    breeds = x["breeds"]
+    colors = x["colors"]
+    attributes = x["attributes"]
+    environment = x["environment"]
+    contact = x["contact"]
+    address = contact["address"]
+    photo = x.get("primary_photo_cropped") or {}
+    return (
+        x["id"],
+        x["name"],
+        x["type"],
+        x["status"],
+        x["organization_id"],
+        x.get("species"),
+        x.get("age"),
+        x.get("gender"),
+        x.get("size"),
+        x.get("coat"),
+        x.get("published_at"),
+        x.get("status_changed_at"),
+        breeds.get("primary"),
+        breeds.get("secondary"),
+        breeds.get("mixed"),
+        breeds.get("unknown"),
+        colors.get("primary"),
+        colors.get("secondary"),
+        colors.get("tertiary"),
+        attributes["spayed_neutered"],
+        attributes["house_trained"],
+        attributes["special_needs"],
+        attributes["shots_current"],
+        attributes.get("declawed"),
+        environment.get("children"),
+        environment.get("dogs"),
+        environment.get("cats"),
+        x.get("description"),
+        x["url"],
+        len(x["photos"]),
+        contact.get("email"),
+        contact.get("phone"),
+        address.get("address1"),
+        address.get("address2"),
+        address.get("city"),
+        address["state"],
+        address["postcode"],
+        address["country"],
+        photo.get("small"),
+        photo.get("medium"),
+        photo.get("large"),
+        photo.get("full"),
     )
+
+
+def animals_dataframe(records: List[Animal]) -> pd.DataFrame:
+    return rows_dataframe(list(map(animal_row, records)))
+
+
+def rows_dataframe(rows: List[tuple]) -> pd.DataFrame:
+    """
+    Builds the animals DataFrame from rows created by animal_row.
+    """
+    animals = pd.DataFrame.from_records(rows, columns=ANIMAL_COLUMNS)
+    animals = animals.astype(ANIMAL_DTYPES)
     animals["published_at"] = pd.to_datetime(animals["published_at"])
     animals["status_changed_at"] = pd.to_datetime(animals["status_changed_at"])
     return animals
 
 
+def photo_rows(x: Animal) -> List[tuple]:
+    """
+    Flattens the photos of an animal into (animal_id, photo_size, photo_url) tuples.
+    """
+    animal_id = x["id"]
+    return [
+        (animal_id, size, url) for photo in x["photos"] for size, url in photo.items()
+    ]
+
+
+def tag_rows(x: Animal) -> List[tuple]:
+    """
+    Flattens the tags of an animal into (animal_id, tag) tuples.
+    """
+    animal_id = x["id"]
+    return [(animal_id, tag) for tag in x.get("tags", [])]
+
+
 def photos_dataframe(records: List[Animal]) -> pd.DataFrame:
-    photos = []
-    for animal in records:
-        animal_id = animal["id"]
-        for photo in animal["photos"]:
-            for size, url in photo.items():
-                photos.append(
-                    {"animal_id": animal_id, "photo_size": size, "photo_url": url}
-                )
-    return pd.DataFrame(photos)
+    return pd.DataFrame.from_records(
+        [row for x in records for row in photo_rows(x)], columns=PHOTO_COLUMNS
+    )
 
 
 def tags_dataframe(records: List[Animal]) -> pd.DataFrame:
-    tags = []
+    return pd.DataFrame.from_records(
+        [row for x in records for row in tag_rows(x)], columns=TAG_COLUMNS
+    )
+
+
+class DataFrames(NamedTuple):
+    animals: pd.DataFrame
+    photos: pd.DataFrame
+    tags: pd.DataFrame
+
+
+def dataframes(records: List[Animal]) -> DataFrames:
+    """
+    Builds the animals, photos, and tags DataFrames in a single pass over the records.
+    """
+    rows, photos, tags = [], [], []
     for animal in records:
-        animal_id = animal["id"]
-        tags.extend(
-            [{"animal_id": animal_id, "tag": tag} for tag in animal.get("tags", [])]
-        )
-    return pd.DataFrame(tags)
+        rows.append(animal_row(animal))
+        photos.extend(photo_rows(animal))
+        tags.extend(tag_rows(animal))
+    return DataFrames(
+        animals=rows_dataframe(rows),
+        photos=pd.DataFrame.from_records(photos, columns=PHOTO_COLUMNS),
+        tags=pd.DataFrame.from_records(tags, columns=TAG_COLUMNS),
+    )
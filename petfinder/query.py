@@ -1,4 +1,10 @@
+import weakref
+from collections import OrderedDict
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import (
+    AsyncContextManager,
     Awaitable,
     Callable,
     Optional,
@@ -9,15 +15,46 @@ from typing import (
     ClassVar,
     Type,
     Iterable,
+    Mapping,
 )
+from urllib.parse import urlencode
 
-import httpx
+from pydantic.class_validators import validator
 from pydantic.main import BaseModel
 
 R = TypeVar("R")
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1024)
+def join_values(values: tuple) -> str:
+    """
+    Joins a list of values into a comma-separated string.
+    The same lists tend to be reused across many requests (every page of a search, for example),
+    so the results are memoized.
+    """
+    return ",".join(values)
+
+
+def freeze_value(v: Any) -> Any:
+    """
+    Stores list values as tuples, so a query's params can't be changed through the caller's lists.
+    """
+    return tuple(v) if isinstance(v, list) else v
+
+
+def freeze_params(params: Mapping[str, Any]) -> tuple:
+    """
+    Converts raw query params into a hashable form, so they can be used as a key.
+    """
+    return tuple(
+        sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())
+    )
+
+
+_finalized_params: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+
 class QueryParams(BaseModel):
     class Config(BaseModel.Config):
         use_enum_values = True
@@ -30,9 +67,44 @@ class QueryParams(BaseModel):
             There are varying standards for stuff like how an array of values should be represented,
             so you should override this method to format in accordance with your API.
             """
-            return ",".join(v) if isinstance(v, list) else v
+            if not isinstance(v, list):
+                return v
+            return v[0] if len(v) == 1 else join_values(tuple(v))
+
+    @validator("*", allow_reuse=True)
+    def convert_to_query_string(cls, v: Any) -> Any:
+        """
+        Converts each value into its query string form as soon as it has been validated,
+        so the validated model can be sent to the API as-is.
+        """
+        return cls.Config.convert_value_to_query_string(v)
+
+    @classmethod
+    def build(cls, query: "Query[Any]") -> Dict[str, Any]:
+        """
+        Validates the raw params of a query and returns them in their final form.
+        Validation only depends on the raw params, so the result is memoized and identical
+        queries (such as repeats of a cached request) skip validating them again.
+        """
+        try:
+            key = (cls, freeze_params(query.params))
+            params = _finalized_params.get(key)
+        except TypeError:
+            # Some of the params can't be hashed (a set, for example), so don't memoize them
+            return cls(__query__=query, **query.params).dict()
+        if params is None:
+            params = cls(__query__=query, **query.params).dict()
+            _finalized_params[key] = params
+            if len(_finalized_params) > 1024:
+                _finalized_params.popitem(last=False)
+        else:
+            _finalized_params.move_to_end(key)
+        # The memoized params are shared, so callers get their own copy
+        return params.copy()
 
     def dict(self, *args, **kwargs):
+        if not args and not kwargs:
+            return self.query_dict()
         kwargs.setdefault("exclude_none", True)
         kwargs.setdefault("by_alias", True)
         return {
@@ -40,17 +112,106 @@ class QueryParams(BaseModel):
             for k, v in super().dict(*args, **kwargs).items()
         }
 
+    @classmethod
+    def display_dict(cls, params: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Converts raw params (plus defaults) into their query string form WITHOUT validating them.
+        This is only intended for displaying queries, so it must never fail or make requests.
+        """
+        convert = cls.Config.convert_value_to_query_string
+        display = {}
+        for name, field in cls.__fields__.items():
+            v = params.get(name, field.default)
+            if v is None:
+                continue
+            if isinstance(v, Enum):
+                v = v.value
+            elif isinstance(v, (list, tuple)):
+                v = [x.value if isinstance(x, Enum) else x for x in v]
+            display[field.alias] = convert(v)
+        return display
+
+    def query_dict(self) -> Dict[str, Any]:
+        """
+        Returns the query string values, keyed by alias and excluding anything which is None.
+        The values were already converted while validating, so this only needs to read them.
+        """
+        values = self.__dict__
+        return {
+            field.alias: values[name]
+            for name, field in self.__fields__.items()
+            if values[name] is not None
+        }
+
+
+def raw_params(query: "Query[Any]") -> Mapping[str, Any]:
+    return query.params
+
+
+class NoSession:
+    """
+    Stands in for an async session when a query wasn't given a way to open one.
+    """
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def rebuild_query(cls: "Type[Query[Any]]", kwargs: Dict[str, Any]) -> "Query[Any]":
+    return cls(**kwargs)
+
+
+# Chained queries which are still alive, so building an identical chain reuses the same instance
+_QUERY_CACHE: "weakref.WeakValueDictionary[tuple, Query[Any]]" = (
+    weakref.WeakValueDictionary()
+)
+
 
 class Query(Generic[R]):
+    """
+    Queries are immutable (including their params); chaining one returns a new query instead of
+    modifying it, so the same instance can safely be shared by everything which builds an
+    identical query.
+    """
+
+    __slots__ = (
+        "path",
+        "params",
+        "executor",
+        "async_executor",
+        "async_batch_executor",
+        "async_session",
+        "_kwargs",
+        "__weakref__",
+    )
     params_class: ClassVar[Optional[Type[QueryParams]]] = None
     path: str
-    params: Dict[str, Any]
+    params: Mapping[str, Any]
     executor: Optional[Callable[["Query[R]"], R]]
     async_executor: Optional[Callable[["Query[R]"], Awaitable[R]]]
     async_batch_executor: Optional[
         Callable[["Iterable[Query[R]]"], Awaitable[Iterable[R]]]
     ]
+    async_session: Optional[Callable[[], AsyncContextManager[Any]]]
     _kwargs: dict
+    _finalize_params: ClassVar[Callable[["Query[Any]"], Mapping[str, Any]]] = staticmethod(
+        raw_params
+    )
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        The params class of a query type never changes, so the function for finalizing its params
+        is resolved once here instead of being worked out on every request.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._finalize_params = (
+            staticmethod(raw_params)
+            if cls.params_class is None
+            else cls.params_class.build
+        )
 
     def __init__(
         self,
@@ -61,28 +222,87 @@ class Query(Generic[R]):
         async_batch_executor: Optional[
             Callable[["Iterable[Query[R]]"], Awaitable[Iterable[R]]]
         ] = None,
+        async_session: Optional[Callable[[], AsyncContextManager[Any]]] = None,
         params: Dict[str, Any] = None,
         **kwargs,
     ) -> None:
-        self.path = path
-        self.params = params or {}
-        self.executor = executor
-        self.async_executor = async_executor
-        self.async_batch_executor = async_batch_executor
-        self._kwargs = kwargs
+        set_attr = object.__setattr__
+        set_attr(self, "path", path)
+        set_attr(
+            self,
+            "params",
+            MappingProxyType({k: freeze_value(v) for k, v in (params or {}).items()}),
+        )
+        set_attr(self, "executor", executor)
+        set_attr(self, "async_executor", async_executor)
+        set_attr(self, "async_batch_executor", async_batch_executor)
+        set_attr(self, "async_session", async_session)
+        set_attr(self, "_kwargs", kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable")
+
+    def __reduce__(self):
+        # The default reduction restores the slots by assigning them, which isn't allowed
+        return (
+            rebuild_query,
+            (
+                self.__class__,
+                dict(
+                    path=self.path,
+                    params=dict(self.params),
+                    executor=self.executor,
+                    async_executor=self.async_executor,
+                    async_batch_executor=self.async_batch_executor,
+                    async_session=self.async_session,
+                    **self._kwargs,
+                ),
+            ),
+        )
 
     def _chain(self: T, **params) -> T:
         """
-        Returns a new instance of this class with the additional query parameters
+        Returns a new instance of this class with the additional query parameters.
+        If an identical query is still alive, that instance is returned instead.
         """
-        return self.__class__(
-            path=self.path,
-            params={**self.params, **params},
-            executor=self.executor,
-            async_executor=self.async_executor,
-            async_batch_executor=self.async_batch_executor,
-            **self._kwargs,
-        )
+        merged = self.params.copy()
+        merged.update((k, freeze_value(v)) for k, v in params.items())
+        key = None
+        if not self._kwargs:
+            try:
+                key = (
+                    self.__class__,
+                    self.path,
+                    freeze_params(merged),
+                    self.executor,
+                    self.async_executor,
+                    self.async_batch_executor,
+                    self.async_session,
+                )
+                query = _QUERY_CACHE.get(key)
+            except TypeError:
+                # Some of the params can't be hashed, so this query can't be shared
+                key = None
+            else:
+                if query is not None:
+                    return query
+        # Everything except the params is shared with this query, so the new instance is
+        # populated directly instead of being passed back through __init__
+        query = object.__new__(self.__class__)
+        set_attr = object.__setattr__
+        set_attr(query, "path", self.path)
+        set_attr(query, "params", MappingProxyType(merged))
+        set_attr(query, "executor", self.executor)
+        set_attr(query, "async_executor", self.async_executor)
+        set_attr(query, "async_batch_executor", self.async_batch_executor)
+        set_attr(query, "async_session", self.async_session)
+        set_attr(query, "_kwargs", self._kwargs)
+        if key is not None:
+            _QUERY_CACHE[key] = query
+        return query
 
     def new_query(self, path: str, **params) -> "Query[Any]":
         """
@@ -94,26 +314,62 @@ class Query(Generic[R]):
             executor=self.executor,
             async_executor=self.async_executor,
             async_batch_executor=self.async_batch_executor,
+            async_session=self.async_session,
         )
 
+    def query_params(self) -> Mapping[str, Any]:
+        """
+        Returns the query parameters in the final form they should be sent to the API.
+
+        If a pydantic model for parsing/validating query parameters has been defined,
+        it is used to parse the raw query params into that finalized form.
+        """
+        return self._finalize_params(self)
+
+    def validated(self) -> "Query[R]":
+        """
+        Returns an equivalent query whose parameters have already been validated and finalized.
+        Queries chained from it will not be validated again, which is useful when the same query
+        is about to be executed many times with only trivial changes (such as the page number).
+        """
+        return Query(
+            path=self.path,
+            params=self.query_params(),
+            executor=self.executor,
+            async_executor=self.async_executor,
+            async_batch_executor=self.async_batch_executor,
+            async_session=self.async_session,
+            **self._kwargs,
+        )
+
+    def open_async_session(self) -> AsyncContextManager[Any]:
+        """
+        Returns a context manager for a session (such as an http client) which several async
+        executions can share, by passing it to the executors.
+        If no way of opening one was provided, it yields None and each execution opens its own.
+        """
+        return self.async_session() if self.async_session else NoSession()
+
     def execute(self) -> R:
         """
         Executes this query asynchronously
         """
         return self.executor(self)
 
-    async def async_execute(self) -> R:
+    async def async_execute(self, **kwargs) -> R:
         """
-        Returns a coroutine for executing this query asynchronously
+        Returns a coroutine for executing this query asynchronously.
+        Any keyword arguments (such as a shared client) are passed through to the executor.
         """
-        return await self.async_executor(self)
+        return await self.async_executor(self, **kwargs)
 
     def __str__(self) -> str:
         if self.params:
             params = (
-                self.params_class.construct(**self.params).dict()
+                self.params_class.display_dict(self.params)
                 if self.params_class
                 else self.params
             )
-            return f"{self.path}?{httpx.QueryParams(params)}"
+            return f"{self.path}?{urlencode(params, doseq=True)}"
         return self.path
+
@@ -0,0 +1,12 @@
+from typing import Any, Union
+
+try:
+    from orjson import loads, dumps
+except ImportError:
+    import json
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
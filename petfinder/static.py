@@ -0,0 +1,116 @@
+import os
+import sys
+import time
+from typing import ClassVar, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from petfinder.caching.core import data_directory
+from petfinder.enums import Category
+from petfinder.types import CategoryType
+from petfinder.serialization import loads, dumps
+
+
+# Category is a str enum, so its members and their raw values find the same entries here
+_CATEGORY_VALUES: Dict[CategoryType, str] = {c: sys.intern(c.value) for c in Category}
+
+
+def category_value(category: CategoryType) -> str:
+    """
+    Returns the value for a type of animal, which is how static data is keyed.
+    """
+    try:
+        return _CATEGORY_VALUES[category]
+    except KeyError:
+        raise ValueError(f"{category!r} is not a valid {Category.__name__}") from None
+
+
+def normalize(names: Iterable[str]) -> FrozenSet[str]:
+    """
+    Lower-cases and interns the names, since they are only used for case-insensitive lookups
+    and the same names (such as colors) are shared by many types of animal.
+    """
+    return frozenset(sys.intern(name.lower()) for name in names)
+
+
+class StaticData:
+    """
+    The breeds and colors for each type of animal.
+    These almost never change, so they are persisted to a JSON file which new processes can reuse
+    instead of fetching them from the API again. Each entry records when it was fetched, so
+    it expires on its own schedule no matter how often the file is rewritten.
+    """
+
+    __slots__ = ("values", "fetched_at", "file", "max_age", "loaded")
+    fields: ClassVar[Tuple[str, ...]] = ("breeds", "colors")
+    values: Dict[Tuple[str, str], FrozenSet[str]]
+    fetched_at: Dict[Tuple[str, str], float]
+    file: str
+    max_age: int
+    loaded: bool
+
+    def __init__(self, file: str = None, max_age: int = 2592000) -> None:
+        self.values = {}
+        self.fetched_at = {}
+        self.file = file
+        self.max_age = max_age
+        self.loaded = False
+
+    def path(self) -> str:
+        return self.file or os.path.join(data_directory(), "static_data_v3.json")
+
+    def get(self, category: str, field: str) -> Optional[FrozenSet[str]]:
+        return self.values.get((category, field))
+
+    def set(self, category: str, field: str, names: Iterable[str]) -> None:
+        self.values[(category, field)] = normalize(names)
+        self.fetched_at[(category, field)] = time.time()
+
+    def load(self) -> None:
+        """
+        Loads the persisted data, unless it has already been loaded.
+        Entries which are too old to trust are skipped, and anything already fetched by this
+        process takes precedence over what's on disk.
+        """
+        if self.loaded:
+            return
+        self.loaded = True
+        now = time.time()
+        try:
+            with open(self.path(), "rb") as infile:
+                data = loads(infile.read())
+            for field in self.fields:
+                for k, entry in data[field].items():
+                    key = (category_value(k), field)
+                    fetched_at = entry["fetched_at"]
+                    if key in self.values or (now - fetched_at) > self.max_age:
+                        continue
+                    self.values[key] = normalize(entry["names"])
+                    self.fetched_at[key] = fetched_at
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+    def save(self) -> None:
+        """
+        Persists the data. The file is written atomically, so concurrent processes never read a
+        partially written file.
+        """
+        data = {field: {} for field in self.fields}
+        for (category, field), names in self.values.items():
+            data[field][category] = {
+                "fetched_at": self.fetched_at[(category, field)],
+                "names": sorted(names),
+            }
+        temp_path = None
+        try:
+            # Finding the path creates the data directory, which may not be writable
+            path = self.path()
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as outfile:
+                outfile.write(dumps(data))
+            os.replace(temp_path, path)
+        except OSError:
+            # Persisting is only an optimization, so failing to save must not break anything
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
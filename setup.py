@@ -25,6 +25,11 @@ install_requires = [
     "typing_extensions",
 ]
 
+extras_require = {
+    "orjson": ["orjson"],
+    "http2": ["httpx[http2]"],
+}
+
 description = "High-performance petfinder API client: async support, efficient caching, query validation, and more"
 
 setup(
@@ -39,6 +44,7 @@ setup(
     author_email="phillip_dupuis@alumni.brown.edu",
     url="https://github.com/phillipdupuis/petfinder-sdk",
     install_requires=install_requires,
+    extras_require=extras_require,
     packages=find_packages(exclude=["scripts"]),
     classifiers=classifiers,
 )